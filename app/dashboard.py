@@ -9,6 +9,7 @@ from mlxtend.frequent_patterns import fpgrowth, association_rules
 from mlxtend.preprocessing import TransactionEncoder
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 import os
+import re
 import joblib
 
 con = None
@@ -68,6 +69,23 @@ CUBE_CONFIG = {
     }
 }
 
+def _year_range(year):
+    """ISO bounds [start, end) covering one season, for comparing against s.date."""
+    return f"{year}-01-01", f"{year + 1}-01-01"
+
+def build_slice_filter(slice_dim, slice_sql, slice_val):
+    """
+    Build the WHERE predicate for a comma-separated slice value.
+    Year slices compare s.date against ISO ranges instead of EXTRACT(YEAR ...),
+    so DuckDB can prune on the raw date column rather than evaluating per row.
+    """
+    safe_vals = [v.strip().replace("'", "''") for v in slice_val.split(",")]
+    if slice_dim == "Year" and all(re.fullmatch(r"[0-9]{4}", v) for v in safe_vals):
+        ranges = [_year_range(int(v)) for v in safe_vals]
+        return "(" + " OR ".join(f"(s.date >= '{lo}' AND s.date < '{hi}')" for lo, hi in ranges) + ")"
+    safe_vals_str = ", ".join(f"'{v}'" for v in safe_vals)
+    return f"{slice_sql} IN ({safe_vals_str})"
+
 def update_cube_options(cube_name):
     """Dynamically updates the dropdown options based on the selected cube."""
     cfg = CUBE_CONFIG[cube_name]
@@ -103,10 +121,8 @@ def evaluate_olap_query(cube_name, x_axis, y_axis, pivot_col, slice_dim, slice_v
     query = f"SELECT {', '.join(select_cols)} FROM {cfg['fact']} {cfg['joins']}"
     
     if slice_dim != "None" and slice_val.strip() != "":
-        slice_sql = cfg["dimensions"][slice_dim]
-        safe_vals = [v.strip().replace("'", "''") for v in slice_val.split(",")]
-        safe_vals_str = ", ".join(f"'{v}'" for v in safe_vals)
-        query += f" WHERE {slice_sql} IN ({safe_vals_str})"
+        slice_filter = build_slice_filter(slice_dim, cfg["dimensions"][slice_dim], slice_val)
+        query += f" WHERE {slice_filter}"
         
     query += f" GROUP BY {', '.join(group_cols)} ORDER BY \"{y_axis}\" DESC LIMIT 100"
     
@@ -124,8 +140,8 @@ def evaluate_olap_query(cube_name, x_axis, y_axis, pivot_col, slice_dim, slice_v
         query_2 = f"SELECT {', '.join(select_2_cols)} FROM {cfg['fact']} {cfg['joins']}"
         
         if slice_dim != "None" and slice_val.strip() != "":
-            # `safe_vals_str` and `slice_sql` are already computed in the main query block
-            query_2 += f" WHERE {slice_sql} IN ({safe_vals_str})"
+            # `slice_filter` is already computed in the main query block
+            query_2 += f" WHERE {slice_filter}"
         
         query_2 += f" GROUP BY {', '.join(group_cols)}"
         query_2 += f" ORDER BY \"Podiums\" DESC, \"Avg_Finish_Position\" ASC LIMIT 100"
@@ -213,10 +229,7 @@ def run_arm(min_supp, min_conf, target_metric, slice_dim, slice_val):
             elif slice_dim == "Circuit":
                 query = query.replace("FROM fact_laps l", "FROM fact_laps l JOIN dim_circuits c ON s.circuit_id = c.circuit_key") # schema check needed
 
-            slice_sql = dim_map[slice_dim]
-            safe_vals = [v.strip().replace("'", "''") for v in slice_val.split(",")]
-            safe_vals_str = ", ".join(f"'{v}'" for v in safe_vals)
-            query += f" AND {slice_sql} IN ({safe_vals_str})"
+            query += f" AND {build_slice_filter(slice_dim, dim_map[slice_dim], slice_val)}"
 
         df = con.sql(query).df()
         
@@ -301,10 +314,7 @@ def run_clustering(n_clusters, segment_type, slice_dim, slice_val):
         where_clause = "WHERE f.speed < 200 AND f.throttle_pct < 50" if segment_type == "Corners" else "WHERE f.speed > 250 AND f.throttle_pct > 90"
         
         if slice_dim != "None" and slice_val.strip() != "":
-            slice_sql = dim_map[slice_dim]
-            safe_vals = [v.strip().replace("'", "''") for v in slice_val.split(",")]
-            safe_vals_str = ", ".join(f"'{v}'" for v in safe_vals)
-            where_clause += f" AND {slice_sql} IN ({safe_vals_str})"
+            where_clause += f" AND {build_slice_filter(slice_dim, dim_map[slice_dim], slice_val)}"
 
         if segment_type == "Corners":
             # Corners: brake timing (proxy: avg brake bool), downshift timing (avg gear), speed
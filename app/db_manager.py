@@ -11,11 +11,12 @@ def get_connection(local_db=None):
         if not os.path.exists(local_db):
             raise FileNotFoundError(f"Local DB not found: {local_db}")
         # Initialize an empty DuckDB, load SQLite scanner, and treat all SQLite columns as strings
-        # to prevent strict conversion crashes on lap times
+        # to prevent strict conversion crashes on lap times. The dashboard never writes, so the
+        # file is attached read-only and scans skip SQLite's write locking.
         con = duckdb.connect()
         con.execute("INSTALL sqlite; LOAD sqlite;")
         con.execute("SET sqlite_all_varchar=true")
-        con.execute(f"ATTACH '{local_db}' AS local_db (TYPE SQLITE)")
+        con.execute(f"ATTACH '{local_db}' AS local_db (TYPE SQLITE, READ_ONLY)")
         con.execute("USE local_db")
         hf_path_template = None
     else:
@@ -367,7 +367,8 @@ def main():
                 con.execute("SET sqlite_all_varchar=true;")
                 con.execute(f"ATTACH '{temp_sqlite}' AS sqlite_db (TYPE SQLITE);")
                 con.execute("USE sqlite_db;")
-                con.execute(f"EXPORT DATABASE '{args.dest}' (FORMAT PARQUET);")
+                # ZSTD keeps the columnar files small for the hf:// reads the dashboard does over HTTP
+                con.execute(f"EXPORT DATABASE '{args.dest}' (FORMAT PARQUET, COMPRESSION ZSTD);")
                 con.close()
                 
                 # Hugging Face attempts to concatenate all .parquet files in a root directory
@@ -2,22 +2,38 @@ import sqlite3
 import os
 
 def get_db(path: str="f1.db"):
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
+    # Room for every loader statement in the compiled-statement cache; rows are
+    # plain tuples since every caller unpacks them positionally
+    conn = sqlite3.connect(path, cached_statements=256)
+    # WAL + relaxed fsync for the bulk loader, bigger page cache and mmap for reads
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-262144")
+    conn.execute("PRAGMA mmap_size=1073741824")
+    conn.execute("PRAGMA busy_timeout=5000")
     return conn
 
 def init_db(year, reset=False):
+    """Create the year's database from the schema and return an open connection to it."""
     path = str(year) + ".db"
     if os.path.exists(path=path) and not reset:
         print("Database already exists. Use reset=True to overwrite.")
-        return
+        db = get_db(path)
+        # Databases built from an older schema lack the lap-id lookup index the loader relies on
+        db.execute("CREATE INDEX IF NOT EXISTS idx_laps_session_driver_lap ON laps(session_id, driver_id, lap_number)")
+        db.commit()
+        return db
 
     with open('sql/schema.sql') as f:
-        if os.path.exists(path=path):
-            os.remove(path)
+        # drop stale WAL/shared-memory files too, or SQLite would replay them into the new file
+        for stale in (path, path + "-wal", path + "-shm"):
+            if os.path.exists(path=stale):
+                os.remove(stale)
         db = get_db(path)
         db.executescript(f.read())
         db.commit()
+    return db
 
 if __name__ == '__main__':
-    init_db(year=2017, reset=True)
\ No newline at end of file
+    init_db(year=2017, reset=True).close()
\ No newline at end of file
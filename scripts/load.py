@@ -1,4 +1,9 @@
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import fastf1
+import numpy as np
 import pandas as pd
 
 from scripts.db import init_db, get_db
@@ -6,6 +11,112 @@ from scripts.db import init_db, get_db
 # Enable FastF1 cache for faster loading
 fastf1.Cache.enable_cache('cache')
 
+# Worker threads used to decode FastF1 telemetry, one driver per task
+TELEMETRY_WORKERS = 8
+
+# Prepared INSERT statements, kept as module constants so every execute and
+# executemany call reuses the same SQL text and hits the statement cache
+CIRCUITS_INSERT_SQL = """
+INSERT INTO circuits (name, rotation)
+VALUES (?, ?)
+"""
+
+DRIVERS_INSERT_SQL = """
+INSERT OR REPLACE INTO drivers
+(name, broadcast_name, driver_number, abbrevation, country, first_name, last_name)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+TEAMS_INSERT_SQL = """
+INSERT OR REPLACE INTO teams (name, color)
+VALUES (?, ?)
+"""
+
+SESSIONS_INSERT_SQL = """
+INSERT INTO sessions (event_name, session_name, date, circuit_id)
+VALUES (?, ?, ?, ?)
+"""
+
+CORNERS_INSERT_SQL = """
+INSERT INTO corners (circuit_id, x, y, number, letter, angle, distance)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+MARSHAL_LIGHTS_INSERT_SQL = """
+INSERT INTO marshal_lights (circuit_id, x, y, number, letter, angle, distance)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+MARSHAL_SECTORS_INSERT_SQL = """
+INSERT INTO marshal_sectors (circuit_id, x, y, number, letter, angle, distance)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+RESULTS_INSERT_SQL = """
+INSERT INTO results
+(driver_id, team_id, session_id, position, classified_position, grid_position,
+ q1, q2, q3, time, status, points, laps)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+WEATHER_INSERT_SQL = """
+INSERT INTO weather
+(timestamp, air_temp, humidity, pressure, rainfall,
+ track_temp, wind_direction, wind_speed, session_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+LAPS_INSERT_SQL = """
+INSERT INTO laps
+(timestamp, session_id, driver_id, lap_number, lap_time, stint,
+ sector1_time, sector2_time, sector3_time, sector1_session_time,
+ sector2_session_time, sector3_session_time, speed1, speed2, speedFL, speedST,
+ personal_best, compound, tyre_life, fresh_tyre, lap_start_time,
+ lap_start_date, track_status, position, pit_in_time, pit_out_time)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+TELEMETRY_INSERT_SQL = """
+INSERT INTO telemetry
+(driver_ahead, dist_to_driver_ahead, time, date, rpm, speed, ngear,
+ throttle, brake, drs, distance, rel_dist, status, X, Y, Z, lap_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _isoformat(value):
+    """Cast for `_column_values` on Timestamp/Timedelta columns."""
+    return value.isoformat()
+
+
+def _column_values(col, cast=None, missing=None):
+    """Convert a DataFrame column to native Python values in one pass.
+
+    NaN/NaT and empty strings become `missing`; everything else is passed
+    through `cast` when one is given. `int` and `float` casts are applied
+    to the whole column at once rather than per cell.
+    """
+    valid = (col.notna() & col.ne('')).to_numpy()
+    if cast is int or cast is float:
+        # Precast the whole column once; object arrays hold native ints/floats
+        numeric = pd.to_numeric(col.where(valid, 0))
+        values = numeric.astype('int64' if cast is int else 'float64').to_numpy(dtype=object)
+        return np.where(valid, values, missing).tolist()
+    values = col.to_numpy(dtype=object)
+    if cast is None:
+        return np.where(valid, values, missing).tolist()
+    return [cast(v) if ok else missing for v, ok in zip(values, valid)]
+
+
+def _circuit_point_rows(circuit_id, points):
+    """Build insert rows for a corners/marshal_lights/marshal_sectors frame."""
+    columns = ['X', 'Y', 'Number', 'Letter', 'Angle', 'Distance']
+    return [
+        (circuit_id, float(x), float(y), int(number), letter, float(angle), float(distance))
+        for x, y, number, letter, angle, distance
+        in points.reindex(columns=columns).itertuples(index=False, name=None)
+    ]
+
 
 def load_circuit_info(session, db):
     """Load circuit information including corners and marshal points."""
@@ -21,61 +132,21 @@ def load_circuit_info(session, db):
 
     # Insert circuit
     cursor = db.cursor()
-    cursor.execute("""
-        INSERT INTO circuits (name, rotation)
-        VALUES (?, ?)
-    """, (session.event['Location'], circuit_info.rotation))
+    cursor.execute(CIRCUITS_INSERT_SQL, (session.event['Location'], circuit_info.rotation))
     circuit_id = cursor.lastrowid
 
     # Insert corners
     if hasattr(circuit_info, 'corners') and circuit_info.corners is not None:
-        for _, corner in circuit_info.corners.iterrows():
-            cursor.execute("""
-                INSERT INTO corners (circuit_id, x, y, number, letter, angle, distance)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                circuit_id,
-                float(corner['X']),
-                float(corner['Y']),
-                int(corner['Number']),
-                corner.get('Letter'),
-                float(corner['Angle']),
-                float(corner['Distance'])
-            ))
+        cursor.executemany(CORNERS_INSERT_SQL, _circuit_point_rows(circuit_id, circuit_info.corners))
 
     # Insert marshal lights
     if hasattr(circuit_info, 'marshal_lights') and circuit_info.marshal_lights is not None:
-        for _, light in circuit_info.marshal_lights.iterrows():
-            cursor.execute("""
-                INSERT INTO marshal_lights (circuit_id, x, y, number, letter, angle, distance)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                circuit_id,
-                float(light['X']),
-                float(light['Y']),
-                int(light['Number']),
-                light.get('Letter'),
-                float(light['Angle']),
-                float(light['Distance'])
-            ))
+        cursor.executemany(MARSHAL_LIGHTS_INSERT_SQL, _circuit_point_rows(circuit_id, circuit_info.marshal_lights))
 
     # Insert marshal sectors
     if hasattr(circuit_info, 'marshal_sectors') and circuit_info.marshal_sectors is not None:
-        for _, sector in circuit_info.marshal_sectors.iterrows():
-            cursor.execute("""
-                INSERT INTO marshal_sectors (circuit_id, x, y, number, letter, angle, distance)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                circuit_id,
-                float(sector['X']),
-                float(sector['Y']),
-                int(sector['Number']),
-                sector.get('Letter'),
-                float(sector['Angle']),
-                float(sector['Distance'])
-            ))
+        cursor.executemany(MARSHAL_SECTORS_INSERT_SQL, _circuit_point_rows(circuit_id, circuit_info.marshal_sectors))
 
-    db.commit()
     return circuit_id
 
 
@@ -89,11 +160,7 @@ def load_drivers_and_teams(session, db):
         existing_driver = cursor.fetchone()
         if existing_driver is None:
             # Insert driver
-            cursor.execute("""
-                INSERT OR REPLACE INTO drivers
-                (name, broadcast_name, driver_number, abbrevation, country, first_name, last_name)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(DRIVERS_INSERT_SQL, (
                 driver_info['FullName'],
                 driver_info.get('BroadcastName'),
                 int(driver_info['DriverNumber']),
@@ -109,32 +176,43 @@ def load_drivers_and_teams(session, db):
         if existing_team is None:
             # Insert team
             team_name = driver_info['TeamName']
-            cursor.execute("""
-                INSERT OR REPLACE INTO teams (name, color)
-                VALUES (?, ?)
-            """, (
+            cursor.execute(TEAMS_INSERT_SQL, (
                 team_name,
                 driver_info.get('TeamColor', '#FFFFFF')
             ))
 
-    db.commit()
     return
 
 
+def session_exists(session, db):
+    """Check whether this session has already been loaded into the database.
+
+    load_event commits the sessions row in the same transaction as the
+    session's results, weather, laps and telemetry, so a row here means the
+    whole event landed; an interrupted load leaves nothing behind to skip.
+    """
+    cursor = db.cursor()
+    cursor.execute(
+        "SELECT 1 FROM sessions WHERE event_name = ? AND session_name = ? AND date IS ?",
+        (
+            session.event['EventName'],
+            session.name,
+            session.date.isoformat() if session.date else None,
+        )
+    )
+    return cursor.fetchone() is not None
+
+
 def load_session(session, circuit_id, db):
     """Load session metadata."""
     cursor = db.cursor()
-    cursor.execute("""
-        INSERT INTO sessions (event_name, session_name, date, circuit_id)
-        VALUES (?, ?, ?, ?)
-    """, (
+    cursor.execute(SESSIONS_INSERT_SQL, (
         session.event['EventName'],
         session.name,
         session.date.isoformat() if session.date else None,
         circuit_id,
     ))
     session_id = cursor.lastrowid
-    db.commit()
     return session_id
 
 
@@ -142,48 +220,50 @@ def load_results(session, session_id, db):
     """Load session results."""
     cursor = db.cursor()
 
-    for _, result in session.results.iterrows():
-        cursor.execute("SELECT id FROM drivers WHERE driver_number = ?", (result['DriverNumber'],))
-        driver_row = cursor.fetchone()
-        if driver_row is None:
-            print(f"  Warning: Driver {result['DriverNumber']} not found in database, skipping result")
+    def safe_int(val):
+        if pd.notna(val) and val != '':
+            return int(val)
+        return None
+
+    # Resolve driver and team ids once instead of querying per result
+    cursor.execute("SELECT driver_number, id FROM drivers")
+    driver_ids = dict(cursor.fetchall())
+    cursor.execute("SELECT name, id FROM teams")
+    team_ids = dict(cursor.fetchall())
+
+    columns = ['DriverNumber', 'TeamName', 'Position', 'ClassifiedPosition', 'GridPosition',
+               'Q1', 'Q2', 'Q3', 'Time', 'Status', 'Points', 'Laps']
+    rows = []
+    for (driver_number, team_name, position, classified_position, grid_position,
+         q1, q2, q3, time, status, points, laps) in (
+            session.results.reindex(columns=columns).itertuples(index=False, name=None)):
+        driver_id = driver_ids.get(int(driver_number))
+        if driver_id is None:
+            print(f"  Warning: Driver {driver_number} not found in database, skipping result")
             continue
-        driver_id = driver_row[0]
-        cursor.execute("SELECT id FROM teams WHERE name = ?", (result['TeamName'],))
-        team_row = cursor.fetchone()
-        if team_row is None:
-            print(f"  Warning: Team {result['TeamName']} not found in database, skipping result")
+        team_id = team_ids.get(team_name)
+        if team_id is None:
+            print(f"  Warning: Team {team_name} not found in database, skipping result")
             continue
-        team_id = team_row[0]
-        # session id
-
-        def safe_int(val):
-            if pd.notna(val) and val != '':
-                return int(val)
-            return None
-
-        cursor.execute("""
-            INSERT INTO results
-            (driver_id, team_id, session_id, position, classified_position, grid_position,
-             q1, q2, q3, time, status, points, laps)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+
+        rows.append((
             driver_id,
             team_id,
             session_id,
-            safe_int(result.get('Position')),
-            result.get('ClassifiedPosition'),
-            safe_int(result.get('GridPosition')),
-            str(result.get('Q1')) if pd.notna(result.get('Q1')) else None,
-            str(result.get('Q2')) if pd.notna(result.get('Q2')) else None,
-            str(result.get('Q3')) if pd.notna(result.get('Q3')) else None,
-            str(result.get('Time')) if pd.notna(result.get('Time')) else None,
-            result.get('Status'),
-            int(result.get('Points', 0)) if pd.notna(result.get('Points')) else 0,
-            safe_int(result.get('Laps'))
+            safe_int(position),
+            classified_position,
+            safe_int(grid_position),
+            str(q1) if pd.notna(q1) else None,
+            str(q2) if pd.notna(q2) else None,
+            str(q3) if pd.notna(q3) else None,
+            str(time) if pd.notna(time) else None,
+            status,
+            int(points) if pd.notna(points) else 0,
+            safe_int(laps)
         ))
 
-    db.commit()
+    cursor.executemany(RESULTS_INSERT_SQL, rows)
+
     return
 
 
@@ -203,24 +283,24 @@ def load_weather_data(session, session_id, db):
             
         if weather is not None and len(weather) > 0:
             cursor = db.cursor()
-            for _, w in weather.iterrows():
-                cursor.execute("""
-                    INSERT INTO weather
-                    (timestamp, air_temp, humidity, pressure, rainfall,
-                     track_temp, wind_direction, wind_speed, session_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    w['Time'].isoformat() if pd.notna(w.get('Time')) else None,
-                    float(w['AirTemp']) if pd.notna(w.get('AirTemp')) else None,
-                    float(w['Humidity']) if pd.notna(w.get('Humidity')) else None,
-                    float(w['Pressure']) if pd.notna(w.get('Pressure')) else None,
-                    bool(w['Rainfall']) if pd.notna(w.get('Rainfall')) else False,
-                    float(w['TrackTemp']) if pd.notna(w.get('TrackTemp')) else None,
-                    int(w['WindDirection']) if pd.notna(w.get('WindDirection')) else None,
-                    float(w['WindSpeed']) if pd.notna(w.get('WindSpeed')) else None,
+            columns = ['Time', 'AirTemp', 'Humidity', 'Pressure', 'Rainfall',
+                       'TrackTemp', 'WindDirection', 'WindSpeed']
+            cursor.executemany(WEATHER_INSERT_SQL, [
+                (
+                    time.isoformat() if pd.notna(time) else None,
+                    float(air_temp) if pd.notna(air_temp) else None,
+                    float(humidity) if pd.notna(humidity) else None,
+                    float(pressure) if pd.notna(pressure) else None,
+                    bool(rainfall) if pd.notna(rainfall) else False,
+                    float(track_temp) if pd.notna(track_temp) else None,
+                    int(wind_direction) if pd.notna(wind_direction) else None,
+                    float(wind_speed) if pd.notna(wind_speed) else None,
                     session_id
-                ))
-            db.commit()
+                )
+                for (time, air_temp, humidity, pressure, rainfall,
+                     track_temp, wind_direction, wind_speed)
+                in weather.reindex(columns=columns).itertuples(index=False, name=None)
+            ])
             print(f"  Loaded {len(weather)} weather records")
         else:
             print(f"  No weather records available")
@@ -251,166 +331,168 @@ def load_laps(session, session_id, db):
         return
 
     cursor = db.cursor()
-    count = 0
 
-    for _, lap in laps.iterrows():
-        cursor.execute("SELECT id FROM drivers WHERE driver_number = ?", (lap['DriverNumber'],))
-        driver_row = cursor.fetchone()
-        if driver_row is None:
-            print(f"  Warning: Driver {lap['DriverNumber']} not found in database, skipping lap")
-            continue
-        driver_id = driver_row[0]
-
-        cursor.execute("""
-            INSERT INTO laps
-            (timestamp, session_id, driver_id, lap_number, lap_time, stint,
-             sector1_time, sector2_time, sector3_time, sector1_session_time,
-             sector2_session_time, sector3_session_time, speed1, speed2, speedFL, speedST,
-             personal_best, compound, tyre_life, fresh_tyre, lap_start_time,
-             lap_start_date, track_status, position, pit_in_time, pit_out_time)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            lap['Time'].isoformat() if pd.notna(lap.get('Time')) else None,
-            session_id,
-            driver_id,
-            int(lap['LapNumber']) if pd.notna(lap.get('LapNumber')) else None,
-            str(lap['LapTime']) if pd.notna(lap.get('LapTime')) else None,
-            int(lap['Stint']) if pd.notna(lap.get('Stint')) else None,
-            str(lap['Sector1Time']) if pd.notna(lap.get('Sector1Time')) else None,
-            str(lap['Sector2Time']) if pd.notna(lap.get('Sector2Time')) else None,
-            str(lap['Sector3Time']) if pd.notna(lap.get('Sector3Time')) else None,
-            lap['Sector1SessionTime'].isoformat() if pd.notna(lap.get('Sector1SessionTime')) else None,
-            lap['Sector2SessionTime'].isoformat() if pd.notna(lap.get('Sector2SessionTime')) else None,
-            lap['Sector3SessionTime'].isoformat() if pd.notna(lap.get('Sector3SessionTime')) else None,
-            float(lap['SpeedI1']) if pd.notna(lap.get('SpeedI1')) else None,
-            float(lap['SpeedI2']) if pd.notna(lap.get('SpeedI2')) else None,
-            float(lap['SpeedFL']) if pd.notna(lap.get('SpeedFL')) else None,
-            float(lap['SpeedST']) if pd.notna(lap.get('SpeedST')) else None,
-            bool(lap['IsPersonalBest']) if pd.notna(lap.get('IsPersonalBest')) else False,
-            lap.get('Compound'),
-            int(lap['TyreLife']) if pd.notna(lap.get('TyreLife')) else None,
-            bool(lap['FreshTyre']) if pd.notna(lap.get('FreshTyre')) else False,
-            lap['LapStartTime'].isoformat() if pd.notna(lap.get('LapStartTime')) else None,
-            lap['LapStartDate'].isoformat() if pd.notna(lap.get('LapStartDate')) else None,
-            lap.get('TrackStatus'),
-            int(lap['Position']) if pd.notna(lap.get('Position')) else None,
-            lap['PitInTime'].isoformat() if pd.notna(lap.get('PitInTime')) else None,
-            lap['PitOutTime'].isoformat() if pd.notna(lap.get('PitOutTime')) else None
-        ))
-        count += 1
-
-        if count % 100 == 0:
-            db.commit()
+    # Resolve driver ids once instead of querying per lap
+    cursor.execute("SELECT driver_number, id FROM drivers")
+    driver_ids = dict(cursor.fetchall())
+
+    driver_col = [driver_ids.get(int(n)) for n in laps['DriverNumber']]
+    for number in sorted({n for n, d in zip(laps['DriverNumber'], driver_col) if d is None}):
+        print(f"  Warning: Driver {number} not found in database, skipping laps")
+
+    # Convert column by column, then stitch the rows back together with zip
+    rows = [
+        row for row in zip(
+            _column_values(laps['Time'], _isoformat),
+            itertools.repeat(session_id),
+            driver_col,
+            _column_values(laps['LapNumber'], int),
+            _column_values(laps['LapTime'], str),
+            _column_values(laps['Stint'], int),
+            _column_values(laps['Sector1Time'], str),
+            _column_values(laps['Sector2Time'], str),
+            _column_values(laps['Sector3Time'], str),
+            _column_values(laps['Sector1SessionTime'], _isoformat),
+            _column_values(laps['Sector2SessionTime'], _isoformat),
+            _column_values(laps['Sector3SessionTime'], _isoformat),
+            _column_values(laps['SpeedI1'], float),
+            _column_values(laps['SpeedI2'], float),
+            _column_values(laps['SpeedFL'], float),
+            _column_values(laps['SpeedST'], float),
+            _column_values(laps['IsPersonalBest'], bool, missing=False),
+            laps['Compound'].tolist(),
+            _column_values(laps['TyreLife'], int),
+            _column_values(laps['FreshTyre'], bool, missing=False),
+            _column_values(laps['LapStartTime'], _isoformat),
+            _column_values(laps['LapStartDate'], _isoformat),
+            laps['TrackStatus'].tolist(),
+            _column_values(laps['Position'], int),
+            _column_values(laps['PitInTime'], _isoformat),
+            _column_values(laps['PitOutTime'], _isoformat)
+        )
+        if row[2] is not None
+    ]
+
+    cursor.executemany(LAPS_INSERT_SQL, rows)
+    print(f"  Loaded {len(rows)} laps")
+
+
+def _driver_lap_ids(db, session_id, driver_abbr):
+    """Map a driver's lap numbers to lap ids for the session in one query."""
+    cursor = db.cursor()
+    cursor.execute("SELECT id FROM drivers WHERE abbrevation = ?", (driver_abbr,))
+    drv_row = cursor.fetchone()
+    if drv_row is None:
+        return {}
+    cursor.execute(
+        "SELECT lap_number, id FROM laps WHERE driver_id = ? AND session_id = ?",
+        (drv_row[0], session_id)
+    )
+    return dict(cursor.fetchall())
 
-    db.commit()
-    print(f"  Loaded {count} laps")
 
+def _telemetry_rows(laps, lap_ids, sample_rate=1):
+    """Decode a driver's laps into telemetry insert rows.
 
-def load_telemetry(session, session_id, driver_abbr, db, sample_rate=1):
-    """Load telemetry data for a specific driver (sampled to reduce data size)."""
-    try:
-        laps = session.laps.pick_drivers(driver_abbr)
-        if laps is None or len(laps) == 0:
-            return 0
+    Touches no database connection, so it can run in a worker thread.
+    """
+    # Merge car and position data once for all of the driver's laps instead of
+    # once per lap, then cut each lap out of it
+    full = laps.get_telemetry()
 
-        cursor = db.cursor()
-        count = 0
+    rows = []
+    for _, lap in laps.iterrows():
+        telemetry = full.slice_by_lap(lap, interpolate_edges=True)
+        if telemetry is None or len(telemetry) == 0:
+            continue
 
-        for _, lap in laps.iterrows():
-            telemetry = lap.get_telemetry()
-            if telemetry is None or len(telemetry) == 0:
-                continue
+        # Distance and driver-ahead are integrated quantities that drift over more
+        # than a lap or two (see FastF1's add_driver_ahead), so redo them per slice
+        telemetry = (telemetry.drop(columns=['Distance', 'RelativeDistance',
+                                             'DriverAhead', 'DistanceToDriverAhead'])
+                     .add_distance().add_relative_distance().add_driver_ahead())
 
-            # Sample the data to reduce size
+        # Sample the data to reduce size (a stride of 1 would only copy the frame)
+        if sample_rate > 1:
             telemetry = telemetry.iloc[::sample_rate]
 
-            # Get driver_id from drivers table
-            cursor.execute("SELECT id FROM drivers WHERE abbrevation = ?", (driver_abbr,))
-            drv_row = cursor.fetchone()
-            driver_id = drv_row[0] if drv_row is not None else None
-
-            # Get lap_id from database matching driver_id, lap_number and session_id
-            lap_id = None
-            if driver_id is not None:
-                cursor.execute(
-                    "SELECT id FROM laps WHERE driver_id = ? AND lap_number = ? AND session_id = ? LIMIT 1",
-                    (driver_id, int(lap.get('LapNumber')), session_id)
-                )
-                lap_row = cursor.fetchone()
-                lap_id = lap_row[0] if lap_row is not None else None
-
-            for _, telem in telemetry.iterrows():
-                # Helper function to safely convert values, handling empty strings
-                def safe_int(val):
-                    if pd.notna(val) and val != '':
-                        return int(val)
-                    return None
-                
-                def safe_float(val):
-                    if pd.notna(val) and val != '':
-                        return float(val)
-                    return None
-                
-                def safe_bool(val):
-                    if pd.notna(val) and val != '':
-                        return bool(val)
-                    return False
-                
-                cursor.execute("""
-                    INSERT INTO telemetry
-                    (driver_ahead, dist_to_driver_ahead, time, date, rpm, speed, ngear,
-                    throttle, brake, drs, distance, rel_dist, status, X, Y, Z, lap_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    safe_int(telem.get('DriverAhead')),
-                    safe_float(telem.get('DistanceToDriverAhead')),
-                    telem['Time'].isoformat() if pd.notna(telem.get('Time')) else None,
-                    telem['Date'].isoformat() if pd.notna(telem.get('Date')) else None,
-                    safe_float(telem.get('RPM')),
-                    safe_float(telem.get('Speed')),
-                    safe_int(telem.get('nGear')),
-                    safe_float(telem.get('Throttle')),
-                    safe_bool(telem.get('Brake')),
-                    safe_int(telem.get('DRS')),
-                    safe_float(telem.get('Distance')),
-                    safe_float(telem.get('RelativeDistance')),
-                    telem.get('Status'),
-                    safe_float(telem.get('X')),
-                    safe_float(telem.get('Y')),
-                    safe_float(telem.get('Z')),
-                    lap_id
-                ))
-                count += 1
-
-        db.commit()
-        return count
+        lap_id = lap_ids.get(int(lap.get('LapNumber')))
+
+        # Convert column by column, then stitch the rows back together with zip
+        rows.extend(zip(
+            _column_values(telemetry['DriverAhead'], int),
+            _column_values(telemetry['DistanceToDriverAhead'], float),
+            _column_values(telemetry['Time'], _isoformat),
+            _column_values(telemetry['Date'], _isoformat),
+            _column_values(telemetry['RPM'], float),
+            _column_values(telemetry['Speed'], float),
+            _column_values(telemetry['nGear'], int),
+            _column_values(telemetry['Throttle'], float),
+            _column_values(telemetry['Brake'], bool, missing=False),
+            _column_values(telemetry['DRS'], int),
+            _column_values(telemetry['Distance'], float),
+            _column_values(telemetry['RelativeDistance'], float),
+            telemetry['Status'].tolist(),
+            _column_values(telemetry['X'], float),
+            _column_values(telemetry['Y'], float),
+            _column_values(telemetry['Z'], float),
+            itertools.repeat(lap_id)
+        ))
+    return rows
+
+
+def _insert_telemetry(cursor, driver_abbr, future):
+    """Insert one driver's decoded telemetry rows; returns how many were loaded."""
+    try:
+        rows = future.result()
+        cursor.executemany(TELEMETRY_INSERT_SQL, rows)
     except Exception as e:
         print(f"    Warning: Could not load telemetry for {driver_abbr}: {e}")
         return 0
+    if rows:
+        print(f"  Loaded {len(rows)} telemetry points for {driver_abbr}")
+    return len(rows)
 
 
-def load_event(year, event, session_num, load_telemetry_data=False):
+def load_session_telemetry(session, session_id, db, sample_rate=1, max_workers=TELEMETRY_WORKERS):
     """
-    Load a complete F1 event into the database.
+    Load telemetry for every driver (sampled to reduce data size), decoding drivers in parallel.
 
-    Args:
-        year: Season year (e.g., 2024)
-        event: Event identifier (e.g., 'Bahrain', 'Monaco', or round number)
-        session_num: Session number (1-5, where 1=FP1, 2=FP2, 3=FP3, 4=Qualifying, 5=Race)
-        load_telemetry_data: Whether to load telemetry (can be very large)
+    FastF1 decoding runs on a thread pool; lap-id lookups and inserts stay on
+    `db` in this thread, since SQLite allows only one writer at a time anyway.
+    At most `max_workers` drivers are in flight, and each driver's rows are
+    released once inserted, so memory stays bounded by a few drivers' rows.
+    Returns the total number of telemetry points loaded.
     """
-    print(f"\nLoading {year} {event} - {session_num}")
+    cursor = db.cursor()
+    cursor.execute("SELECT abbrevation FROM drivers")
+    driver_abbrs = [row[0] for row in cursor.fetchall()]
 
-    try:
-        # Load the session
-        session = fastf1.get_session(year, event, session_num)
-        session.load(telemetry=load_telemetry_data, messages=False, laps=True, weather=True)
-    except Exception as e:
-        print(f"Error loading session data: {e}")
-        return
+    total_telem = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for driver_abbr in driver_abbrs:
+            try:
+                laps = session.laps.pick_drivers(driver_abbr)
+            except Exception as e:
+                print(f"    Warning: Could not load telemetry for {driver_abbr}: {e}")
+                continue
+            if laps is None or len(laps) == 0:
+                continue
+            lap_ids = _driver_lap_ids(db, session_id, driver_abbr)
+            pending.append((driver_abbr, executor.submit(_telemetry_rows, laps, lap_ids, sample_rate)))
+
+            # Insert in submission order while later drivers are still decoding
+            if len(pending) >= max_workers:
+                total_telem += _insert_telemetry(cursor, *pending.popleft())
 
-    db = get_db(path=str(year)+".db")
+        while pending:
+            total_telem += _insert_telemetry(cursor, *pending.popleft())
+    return total_telem
 
+
+def _load_session_data(session, db, load_telemetry_data=False):
+    """Run every loader for an already-loaded FastF1 session."""
     # Load circuit info
     print("Loading circuit info...")
     try:
@@ -419,10 +501,8 @@ def load_event(year, event, session_num, load_telemetry_data=False):
         print(f"  Warning: Could not load circuit info: {e}")
         # Create a basic circuit entry
         cursor = db.cursor()
-        cursor.execute("INSERT INTO circuits (name, rotation) VALUES (?, ?)",
-                      (session.event.get('Location', 'Unknown'), 0))
+        cursor.execute(CIRCUITS_INSERT_SQL, (session.event.get('Location', 'Unknown'), 0))
         circuit_id = cursor.lastrowid
-        db.commit()
 
     # Load drivers and teams
     print("Loading drivers and teams...")
@@ -447,30 +527,77 @@ def load_event(year, event, session_num, load_telemetry_data=False):
     # Load telemetry (optional, can be very large)
     if load_telemetry_data:
         print("Loading telemetry data (sampled)...")
-        total_telem = 0
-        cursor = db.cursor()
-        cursor.execute("SELECT abbrevation FROM drivers")
-        driver_abbrs = [row[0] for row in cursor.fetchall()]
-        for driver_abbr in driver_abbrs:
-            count = load_telemetry(session, session_id, driver_abbr, db)
-            if count > 0:
-                print(f"  Loaded {count} telemetry points for {driver_abbr}")
-                total_telem += count
+        total_telem = load_session_telemetry(session, session_id, db)
         print(f"Total telemetry points: {total_telem}")
 
-    db.close()
+
+def load_event(year, event, session_num, load_telemetry_data=False, db=None):
+    """
+    Load a complete F1 event into the database.
+
+    The event is written in a single transaction, so it either lands whole
+    or not at all.
+
+    Args:
+        year: Season year (e.g., 2024)
+        event: Event identifier (e.g., 'Bahrain', 'Monaco', or round number)
+        session_num: Session number (1-5, where 1=FP1, 2=FP2, 3=FP3, 4=Qualifying, 5=Race)
+        load_telemetry_data: Whether to load telemetry (can be very large)
+        db: Open connection to the year's database. Reusing one connection across
+            events keeps SQLite's page and statement caches warm; if omitted, a
+            connection is opened and closed for this event only.
+    """
+    print(f"\nLoading {year} {event} - {session_num}")
+
+    try:
+        session = fastf1.get_session(year, event, session_num)
+    except Exception as e:
+        print(f"Error loading session data: {e}")
+        return
+
+    own_db = db is None
+    if own_db:
+        db = get_db(path=str(year)+".db")
+
+    try:
+        # Skip re-runs before FastF1 fetches and parses the session data
+        if session_exists(session, db):
+            print(f"  {session.event['EventName']} - {session.name} already exists in database, skipping")
+            return
+
+        try:
+            # Load the session
+            session.load(telemetry=load_telemetry_data, messages=False, laps=True, weather=True)
+        except Exception as e:
+            print(f"Error loading session data: {e}")
+            return
+
+        # Load the whole event in one write transaction; the loaders never commit
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            _load_session_data(session, db, load_telemetry_data)
+            db.commit()
+        except BaseException:
+            db.rollback()
+            raise
+    finally:
+        if own_db:
+            db.close()
     print(f"\n Successfully loaded {year} {event} - {session_num}")
 
 
 if __name__ == '__main__':
     years = range(2018, 2026)
     for year in years:
-        # Load all events for the year
-        init_db(year=year)
-        schedule = fastf1.get_event_schedule(year)
-        for _, event in schedule.iloc[1:].iterrows():
-            try:
-                for i in range(5, 6):
-                    load_event(year, event['EventName'], session_num=i, load_telemetry_data=True)
-            except Exception as e:
-                print(f"Error loading {year} {event['EventName']}: {e}")
+        # Load all events for the year over a single connection
+        db = init_db(year=year)
+        try:
+            schedule = fastf1.get_event_schedule(year)
+            for _, event in schedule.iloc[1:].iterrows():
+                try:
+                    for i in range(5, 6):
+                        load_event(year, event['EventName'], session_num=i, load_telemetry_data=True, db=db)
+                except Exception as e:
+                    print(f"Error loading {year} {event['EventName']}: {e}")
+        finally:
+            db.close()
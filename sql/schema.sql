@@ -158,4 +158,8 @@ CREATE TABLE telemetry (
     Z FLOAT,
     lap_id INTEGER,
     FOREIGN KEY (lap_id) REFERENCES laps(id)
-);
\ No newline at end of file
+);
+
+-- INDEXES --
+
+CREATE INDEX idx_laps_session_driver_lap ON laps(session_id, driver_id, lap_number);